@@ -66,10 +66,15 @@ def read_oce_from_config(config: Config) -> dict[NDArray]:
         coords=oce_coords,
         preprocess=partial(Utils.drop_dims_from_dataset, drop_dims=drop_dims),
         decode_vars=config.input.oce.decode_vars_with_xarray,
+        chunks={oce_dims["time"]: "auto"},
         **oce_domain,
     )
-    temperature = oce_dataset[oce_vars["temperature"]]
-    salinity = oce_dataset[oce_vars["salinity"]]
+    # Temperature and salinity in single precision (halving memory traffic),
+    # depth coordinate is kept as it is.
+    temperature = oce_dataset[oce_vars["temperature"]].astype(
+        np.float32, keep_attrs=True
+    )
+    salinity = oce_dataset[oce_vars["salinity"]].astype(np.float32, keep_attrs=True)
     assert (
         temperature.shape == salinity.shape
     ), "Temperature and saliniy do not have the same shape."
@@ -316,6 +321,19 @@ class Mean(cli.Application):
     Mean values obtained from mean profiles in the user-defined region.
     """
 
+    def compute_mean_region_depth(self) -> None:
+        """
+        Compute mean sea floor depth in the region, from bathymetry.
+        """
+        seafloor_depth = read_bathy_from_config(self.config)
+        self.seafloor_depth = seafloor_depth
+        if np.ndim(seafloor_depth) == 0:
+            self.mean_region_depth = abs(float(seafloor_depth))
+        else:
+            # Single (lazy) reduction to a scalar, land cells (NaN) are skipped.
+            self.mean_region_depth = float(abs(seafloor_depth).mean(skipna=True))
+        logging.info(f"Mean region depth: {self.mean_region_depth} m")
+
     def compute_density(self) -> None:
         """
         Compute Density from Pot. Temperature & Salinity.
@@ -325,17 +343,20 @@ class Mean(cli.Application):
         ref_pressure = 0  # reference pressure [dbar]
         salinity = self.salinity
         temperature = self.temperature
-        pot_density = OceBaroclinicModes.potential_density(
-            temperature,
-            salinity,
-            self.depth,
-            insitu_temperature=config.input.oce.insitu_temperature,
-            ref_pressure=ref_pressure,
+        # Density is computed and averaged in a single pass (no 4D density field).
+        # Reduction is lazy (and chunked) for dask-backed datasets.
+        mean_region_potdensity = np.asarray(
+            OceBaroclinicModes.potential_density(
+                temperature,
+                salinity,
+                self.depth,
+                insitu_temperature=config.input.oce.insitu_temperature,
+                ref_pressure=ref_pressure,
+                mean_axis=temperature.get_axis_num(self.depth.dims[0]),
+            )
         )
-        mean_region_potdensity = pot_density.mean(
-            dim=["time", "longitude", "latitude"], skipna=True
-        ).values
-        # VERTICAL INTERPOLATION (1m grid step)
+        # VERTICAL INTERPOLATION (1m grid step), down to the mean region depth
+        # (set by compute_mean_region_depth).
         logging.info("Vertically interpolating mean density ...")
         grid_step = self.grid_step
         interpolation = Interpolation(self.depth.values, mean_region_potdensity)
@@ -414,16 +435,14 @@ class Mean(cli.Application):
         logging.info("Computing baroclinic modes and Rossby radii ...")
         # N° of modes of motion considered (including the barotropic one).
         N_motion_modes = config.output.n_modes
-        mean_lat = np.mean(self.latitude.values)
+        # Latitude is already cropped to the domain: reduce it once to Python floats.
+        latitude = np.asarray(self.latitude)
+        mean_lat = float(latitude.mean())
         self.mean_lat = mean_lat
         # Warning if the region is too near the equator.
         equator_threshold = 2.0
-        lower_condition = (
-            -equator_threshold < np.min(self.latitude.values) < equator_threshold
-        )
-        upper_condition = (
-            -equator_threshold < np.max(self.latitude.values) < equator_threshold
-        )
+        lower_condition = -equator_threshold < float(latitude.min()) < equator_threshold
+        upper_condition = -equator_threshold < float(latitude.max()) < equator_threshold
         if Utils.andor(lower_condition, upper_condition):
             warnings.warn(
                 "The domain area is close to the equator: ! Rossby radii computation might be inaccurate !"
@@ -482,6 +501,8 @@ class Mean(cli.Application):
                 config.output.folder_path, filename=config.output.filename, logfile=True
             )
             logging.info(f"Using config file {config.config_file}")
+            # MEAN REGION DEPTH (from bathymetry), needed for density interpolation.
+            self.compute_mean_region_depth()
 
         except Exception as e:
             # Log any unhandled exceptions
@@ -75,7 +75,7 @@ class OceBaroclinicModes:
         self.rossby_rad = rossby_rad
         self.vert_structfunc = vert_structfunc
         n_depth_levels = vert_structfunc.shape[0]
-        self.depth = np.array([i * grid_step for i in range(n_depth_levels)])
+        self.depth = np.arange(n_depth_levels) * grid_step
 
     @staticmethod
     def potential_density(
@@ -84,9 +84,13 @@ class OceBaroclinicModes:
         depth: NDArray = None,
         insitu_temperature: bool = False,
         ref_pressure: float = 0,  # reference pressure [dbar]
+        mean_axis: int = None,
     ) -> tuple[NDArray]:
         """
         Compute Density from Pot. Temperature & Salinity.
+
+        NOTE: if 'mean_axis' is given, the mean profile along that axis is returned
+              instead (density is computed and averaged in a single pass).
         """
         assert (
             temperature.shape == salinity.shape
@@ -104,6 +108,10 @@ class OceBaroclinicModes:
             )
         else:
             pot_temperature = temperature
+        if mean_axis is not None:
+            return EoS.mean_density_profile(
+                salinity, pot_temperature, ref_pressure, axis=mean_axis
+            )
         pot_density = EoS.compute_density(salinity, pot_temperature, ref_pressure)
         return pot_density
 
@@ -5,6 +5,10 @@ except ImportError:
     import toml as tomllib
 
 import os
+import copy
+
+# Parsed config files, keyed by (real path, modification time, size).
+_CONFIG_CACHE: dict[tuple, dict] = {}
 
 
 class Config:
@@ -44,19 +48,23 @@ class Config:
         :param config_path: path to the config file
         :return: returns nothing
         """
-        with open(config_path, mode="r") as f:
-            self.config_dict = tomllib.loads(f.read())
+        stat = os.stat(config_path)
+        key = (os.path.realpath(config_path), stat.st_mtime_ns, stat.st_size)
+        # Parse the file only if it is new or has changed since last reading.
+        if key not in _CONFIG_CACHE:
+            with open(config_path, mode="r") as f:
+                _CONFIG_CACHE[key] = tomllib.loads(f.read())
+        # Copy, so that changes to this configuration do not affect the cache.
+        self.config_dict = copy.deepcopy(_CONFIG_CACHE[key])
         return self.config_dict
 
     def __from_dict_to_attrs__(self) -> None:
         """
         Set attributes out of config dictionary.
         """
+        # setattr overwrites existing attributes (no lookup/delete needed).
         for k, v in self.config_dict.items():
-            if hasattr(self, k):
-                delattr(self, k)  # Overwrite attribute
-            attr = getattr(self, k, v)
-            setattr(self, k, AttrDict(attr))
+            setattr(self, k, AttrDict(v))
 
 
 class AttrDict(dict):
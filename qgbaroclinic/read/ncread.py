@@ -35,38 +35,29 @@ class ncRead:
         coords: dict[str] = None,
         preprocess: callable = None,
         decode_vars: bool = False,
+        chunks: dict[str] or str = None,
         **domain: dict[list],
     ) -> Dataset:
         """
         Extract Dataset out of a NetCDF file, given dimensions and variables.
+        Variables are dask arrays, split in 'chunks' (as in xarray.open_mfdataset),
+        so that reductions are streamed block-wise.
         """
         try:
             engine = "h5netcdf"
-            dataset = xr.open_mfdataset(
-                self.path,
-                concat_dim=None,
-                combine="by_coords",
-                parallel=True,
+            dataset = self.__open_dataset(
                 preprocess=preprocess,
-                engine="h5netcdf",
-                cache=True,
-                lock=False,
-                decode_times=True,
+                engine=engine,
+                chunks=chunks,
                 decode_cf=decode_vars,
                 # mask_and_scale = False,
             )
         except (ValueError, OSError):
             engine = "scipy"  # "netcdf4"
-            dataset = xr.open_mfdataset(
-                self.path,
-                concat_dim=None,
-                combine="by_coords",
-                parallel=True,
+            dataset = self.__open_dataset(
                 engine=engine,
-                cache=True,
-                lock=False,
+                chunks=chunks,
                 decode_cf=decode_vars,
-                decode_times=True,
                 # mask_and_scale = False,
             )
         logging.info(f"Open NetCDF file(s) with {engine} engine.")
@@ -90,10 +81,10 @@ class ncRead:
                 # Rename coordinates as dimensions
                 name_dict = {k: v for k, v in zip(coords.values(), dims.values())}
                 dataset = dataset.rename(name_dict)
+        # Crop dataset (before transposing, so that only the domain is reordered).
+        dataset = self.crop_dataset(dataset, **domain)
         # Transpose dataset coherently with the dims argument.
         dataset = dataset.transpose(*dims.values(), ..., missing_dims="raise")
-        # Crop dataset
-        dataset = self.crop_dataset(dataset, **domain)
         # Decode variables manually
         if decode_vars is False:
             dataset = self.decode_vars(dataset)
@@ -104,29 +95,9 @@ class ncRead:
         Extract variable(s) from NetCDF file, given the name(s).
         """
         try:
-            dataset = xr.open_mfdataset(
-                self.path,
-                concat_dim=None,
-                combine="by_coords",
-                parallel=True,
-                engine="netcdf4", #"h5netcdf",
-                cache=True,
-                lock=False,
-                decode_times=True,
-                decode_cf=True,
-            )
+            dataset = self.__open_dataset(engine="netcdf4", decode_cf=True)
         except Exception:
-            dataset = xr.open_mfdataset(
-                    self.path,
-                    concat_dim=None,
-                    combine="by_coords",
-                    parallel=True,
-                    engine="scipy",
-                    cache=True,
-                    lock=False,
-                    decode_times=True,
-                    decode_cf=True,
-                )
+            dataset = self.__open_dataset(engine="scipy", decode_cf=True)
         dataset = self.crop_dataset(dataset, **domain)
         variables = ()
         for name in names:
@@ -135,6 +106,21 @@ class ncRead:
         dataset.close()
         return variables
 
+    def __open_dataset(self, **kwargs) -> Dataset:
+        """
+        Open NetCDF file(s) with the given options (as in xarray.open_mfdataset).
+        """
+        return xr.open_mfdataset(
+            self.path,
+            concat_dim=None,
+            combine="by_coords",
+            parallel=True,
+            cache=True,
+            lock=False,
+            decode_times=True,
+            **kwargs,
+        )
+
     def var_asattr(self, *names: tuple[str]) -> None:
         """
         Set variable(s) as attributes.
@@ -175,7 +161,8 @@ class ncRead:
                     "Please, provide both or none domain extremants. Only one is not accepted."
                 )
             [id_min, id_max] = np.sort([id_min, id_max])
-            new_domain[key] = np.arange(id_min, id_max + 1)
+            # Basic (slice) indexing: lazy, contiguous reads, no index arrays.
+            new_domain[key] = slice(int(id_min), int(id_max) + 1)
         cropped_dataset = dataset.isel(new_domain, missing_dims="warn")
         return cropped_dataset
 
@@ -183,14 +170,17 @@ class ncRead:
         """
         Decode variables "by hand" if having troubles with xarray decoding.
         """
-        for var in dataset.var():
+        for var in dataset.data_vars:
             if dataset[var].dtype == "int16":
                 scale_factor = dataset[var].scale_factor
                 add_offset = dataset[var].add_offset
-                decode_values = dataset[var].values * np.float64(
-                    scale_factor
-                ) + np.float64(add_offset)
-                dataset[var].values = decode_values
+                # Lazy expression (no '.values'): decoding is fused with the
+                # following reductions, block by block, for dask-backed datasets.
+                # Single precision is enough for packed (int16) data.
+                decode_values = dataset[var] * np.float32(scale_factor) + np.float32(
+                    add_offset
+                )
+                dataset[var] = decode_values.assign_attrs(dataset[var].attrs)
         return dataset
 
 
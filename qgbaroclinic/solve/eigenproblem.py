@@ -1,5 +1,6 @@
 import numpy as np
 import scipy as sp
+from numba import njit
 from numpy.typing import NDArray
 
 
@@ -20,6 +21,7 @@ class EigenProblem:
 
         Args:
             lhs_matrix (NDArray): L.H.S. matrix of eigenvalues/eigenvectors problem
+                                  (or tuple of its diagonals, if tridiagonal)
             rhs_matrix (NDArray, optional): R.H.S. matrix of eigenvalues/eigenvectors problem. Defaults to None.
             grid_step (NDArray, optional): grid step used for computing L.H.S matrix. Defaults to None.
             n_modes (int, optional): _description_. Defaults to 4.
@@ -59,33 +61,29 @@ class EigenProblem:
         Compute as many eigenvalues as n_modes, for a tridiagonal matrix.
 
         Exploits scipy algorithm.
+        NOTE: the matrix may be given directly as tuple (diagonal, off-diagonal).
         """
 
-        tridiagmatrix = lhs_matrix
-        # extract diagonal and subdiagonal
-        d = np.diagonal(tridiagmatrix, offset=0).copy()
-        e = np.diagonal(tridiagmatrix, offset=1).copy()
-        # Compute eigenvalues using scipy
+        if isinstance(lhs_matrix, tuple):
+            d, e = (np.ascontiguousarray(diag, dtype=np.float64) for diag in lhs_matrix)
+        else:
+            # extract diagonal and subdiagonal
+            d = np.diagonal(lhs_matrix, offset=0).copy()
+            e = np.diagonal(lhs_matrix, offset=1).copy()
+        # Compute only the smallest n_modes eigenvalues using scipy
+        # (returned in ascending order).
         eigenprob_result = sp.linalg.eigh_tridiagonal(
             d,
             e,
-            lapack_driver="auto",
-            select="a",
-            select_range=(0,),
+            lapack_driver="stebz",
+            select="i",
+            select_range=(0, min(n_modes, d.shape[0]) - 1),
             eigvals_only=eigvals_only,
         )
         if not eigvals_only:
-            eigenvalues, eigenvectors = eigenprob_result
-        else:
-            eigenvalues, eigenvectors = eigenprob_result, None
-        # Take real part of eigenvalues and sort them in ascending order.
-        eigenvalues = np.real(eigenvalues)
-        sort_index = np.argsort(eigenvalues)
-        eigenvals = eigenvalues[sort_index][:n_modes]
-        if not eigvals_only:
-            eigenvecs = eigenvectors[:, sort_index][:, :n_modes]
+            eigenvals, eigenvecs = eigenprob_result
         else:
-            eigenvecs = None
+            eigenvals, eigenvecs = eigenprob_result, None
         return eigenvals, eigenvecs
 
     def eigenvals_generalizedprob(self) -> NDArray:
@@ -97,6 +95,8 @@ class EigenProblem:
             A * w = lambda * B * w  (lambda eigenvalues, w eigenvectors)
 
             with BCs: w = 0 at z=0,1 .
+            (A, B are expected with changed sign w.r.t. d^2/dz^2 and -S,
+            for consistency with scipy algorithm.)
 
         Here, a scipy algorithm is used.
         """
@@ -104,9 +104,26 @@ class EigenProblem:
         A: NDArray = self.lhs_matrix
         B: NDArray = self.rhs_matrix
         n_modes: int = self.n_modes
-        # Change sign to matrices (for consistency with scipy algorithm).
-        A *= -1
-        B *= -1
+        # Sparse matrices (A is banded, B diagonal): O(n) matrix-vector products
+        # and sparse LU factorization in shift-invert mode.
+        # NOTE: scipy needs a dense solver instead, if k >= N - 1 (tiny problems).
+        if n_modes - 1 < A.shape[0] - 1:
+            A = sp.sparse.csc_matrix(A)
+            B = sp.sparse.csc_matrix(B)
+        else:
+            A = A.toarray() if sp.sparse.issparse(A) else A
+            B = B.toarray() if sp.sparse.issparse(B) else B
+        # If B is diagonal and invertible, solve the equivalent standard problem
+        # B^-1 * A * w = lambda * w (row scaling), so that shift-invert mode
+        # needs no products/solves with B.
+        B_diag = B.diagonal()
+        B_nnz = B.count_nonzero() if sp.sparse.issparse(B) else np.count_nonzero(B)
+        if np.all(B_diag != 0) and B_nnz == B_diag.shape[0]:
+            if sp.sparse.issparse(A):
+                A = sp.sparse.diags(1 / B_diag, format="csc") @ A
+            else:
+                A = A / B_diag[:, np.newaxis]
+            B = None
         # Compute smallest Eigenvalues.
         val, vecs = sp.sparse.linalg.eigs(
             A,
@@ -138,19 +155,15 @@ class EigenProblem:
         # Define integration constant phi_0 = phi(z = 0) = 1 as BC.
         phi_barotropic = 1
         phi_0 = np.ones(n_modes) * phi_barotropic
-        # Define f_n(z).
-        f_n = np.empty([n, n_modes])
-        for i in range(n_modes):
-            f_n[:, i] = -eigenvalues[i] * S[:]
+        # Define f_n(z), one column per mode.
+        f_n = -S[:, np.newaxis] * eigenvalues[np.newaxis, :n_modes]
         # Define dw_0 = dw/dz at z=0.
         dw_0 = -eigenvalues * phi_0
         # Define BCs: w_0 = w(z=0) = 0 ; w_n = w(z=1) = 0.
         w_0 = 0
         w_n = 0
-        # Compute eigenvectors through Numerov's Algortihm.
-        w = np.empty([n, n_modes])
-        for i in range(n_modes):
-            w[:, i] = EigenProblem.numerov_method(dz, f_n[:, i], dw_0[i], w_0, w_n)
+        # Compute eigenvectors through Numerov's Algortihm (all modes at once).
+        w = EigenProblem.numerov_method(dz, f_n, dw_0, w_0, w_n)
         return w
 
     @staticmethod
@@ -169,8 +182,9 @@ class EigenProblem:
             vertical grid step
         f : <class 'numpy.ndarray'>
             problem parameter, depending on z
-        dw_0 : 'float'
-            first derivative of w: dw/dz computed at z = 0.
+            (2D array of shape (n, n_modes) for solving many modes at once)
+        dw_0 : 'float' or <class 'numpy.ndarray'>
+            first derivative of w: dw/dz computed at z = 0 (one per mode).
         w_0, w_N : 'float'
                 BCs, respectively at z = 0,1
 
@@ -189,10 +203,12 @@ class EigenProblem:
         where phi_0 = phi(z=0) set = 1 as BC.
         """
 
+        # Contiguous float64 profile(s), for the compiled recurrence.
+        f = np.ascontiguousarray(f, dtype=np.float64)
         # Number of vertical levels.
-        n = len(f)
+        n = f.shape[0]
         # Store array for eigenvectors ( w(0) = w(n-1) = 0 for BCs).
-        w = np.empty([n])
+        w = np.empty(f.shape)
         w[0] = w_0
         w[n - 1] = w_n
         # Define constant k
@@ -201,11 +217,28 @@ class EigenProblem:
         w[1] = (w[0] + dz * dw_0 + (1 / 3) * (dz**2) * f[0] * w[0]) / (
             1 - k * 2 * f[1]
         )
-        # Numerov's algorithm.
+        # Numerov's coefficients, computed once for all levels.
+        a = 1.0 - k * f
+        b = 2.0 + 10.0 * k * f
+        # Numerov's algorithm (modes along the second axis).
+        EigenProblem.__numerov_kernel(
+            w.reshape(n, -1), a.reshape(n, -1), b.reshape(n, -1)
+        )
+        return w
+
+    @staticmethod
+    @njit(fastmath=True, nogil=True, error_model="numpy", cache=True)
+    def __numerov_kernel(w: NDArray, a: NDArray, b: NDArray) -> NDArray:
+        """
+        Compiled Numerov's recurrence, filling w (n, n_modes) in place from w[0], w[1].
+        """
+
+        n, n_modes = a.shape
         for j in range(2, n - 1):
-            w[j] = (1 / (1 - k * f[j])) * (
-                (2 + 10 * k * f[j - 1]) * w[j - 1] - (1 - k * f[j - 2]) * w[j - 2]
-            )
+            for i in range(n_modes):
+                w[j, i] = (
+                    b[j - 1, i] * w[j - 1, i] - a[j - 2, i] * w[j - 2, i]
+                ) / a[j, i]
         return w
 
 
@@ -304,23 +337,25 @@ if __name__ == "__main__":
         eigenprob_general.eigenvecs = VerticalStructureEquation.normalize_eigenfunc(
             eigenprob_general.eigenvecs, dx
         )
-        for n in range(1, 4):
+        # Modes are set up (and solved) once, outside the checking loop.
+        modes = np.arange(1, 4)
+        eigenvals = modes * np.pi / L
+        # Theoretical solutions (normalized using VerticalStructureEquation method)
+        theor_sols = VerticalStructureEquation.normalize_eigenfunc(
+            np.sin(x[:, np.newaxis] * eigenvals), dx
+        )
+        # Numerical solutions (all modes at once), with w = 0 at both ends.
+        f = np.broadcast_to(-(eigenvals**2), (N, modes.size))
+        num_sols = EigenProblem.numerov_method(dx, f, eigenvals, 0, 0)
+        num_sols = VerticalStructureEquation.normalize_eigenfunc(num_sols, dx)
+        # Depth axis (downward) for plots, shared by all modes.
+        minus_x = np.negative(x)
+        for i, n in enumerate(modes):
             # change sign of SCIPY eigenvectors due to LAPACK algorithm
             if eigenprob_general.eigenvecs[0, n] < 0:
                 eigenprob_general.eigenvecs[:, n] *= -1
-            eigenvals = n * np.pi / L
-            # Theoretical solution (normalized using VerticalStructureEquation method)
-            theor_sol = VerticalStructureEquation.normalize_eigenfunc(
-                np.sin(eigenvals * x), dx
-            )
-            # Numerical solution
-            w_0 = 0
-            w_n = 0
-            dw_0 = n * np.pi / L
-            f_val = -(eigenvals**2)
-            f = np.full(N, f_val)
-            num_sol = EigenProblem.numerov_method(dx, f, dw_0, w_0, w_n)
-            num_sol = VerticalStructureEquation.normalize_eigenfunc(num_sol, dx)
+            theor_sol = theor_sols[:, i]
+            num_sol = num_sols[:, i]
             assert np.allclose(num_sol, theor_sol)
             error = np.nanmean(num_sol - theor_sol)
             print(f"Mean absolute error associated to Numerov's method is: {error}")
@@ -337,14 +372,14 @@ if __name__ == "__main__":
                 plt.title(
                     f"Numerov's (coloured) VS theoretical (dashed) solutions.\n Mode of motion *{n}*"
                 )
-                plt.plot(theor_sol, -x, "k--")
-                plt.plot(num_sol, -x)
+                plt.plot(theor_sol, minus_x, "k--")
+                plt.plot(num_sol, minus_x)
                 plt.figure()
                 plt.title(
                     f"Scipy (coloured) VS theoretical (dashed) solutions.\n Mode of motion *{n}*"
                 )
-                plt.plot(theor_sol, -x, "k--")
-                plt.plot(eigenprob_general.eigenvecs[:, n], -x)
+                plt.plot(theor_sol, minus_x, "k--")
+                plt.plot(eigenprob_general.eigenvecs[:, n], minus_x)
                 plt.show()
                 plt.close()
 
@@ -1,4 +1,7 @@
 import sys, os
+import math
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import numpy as np
 import scipy as sp
 from tqdm import tqdm
@@ -65,47 +68,24 @@ class VerticalStructureEquation:
 
         s_param = VerticalStructureEquation.compute_problem_sparam(bvfreq, mean_lat)
         flatten_array = s_param.reshape(-1, s_param.shape[-1])
-        flatten_bathy_array = bottom_depth.reshape(-1)
-        eigenvals_list = []
-        vert_structfunc_list = []
-        for i in tqdm(range(flatten_array.shape[0])):
-            bottom = int(flatten_bathy_array[i])
-            profile = flatten_array[i, : bottom + 1]
-            try:
-                if rossbyrad_only:
-                    tridiagmatrix = (
-                        VerticalStructureEquation.tridiag_matrix_standardprob(
-                            profile, dz=grid_step
-                        )
-                    )
-                    eigenvalues, vert_structfunc = EigenProblem.tridiag_eigensolver(
-                        tridiagmatrix, n_modes, eigvals_only=rossbyrad_only
-                    )
-                else:
-                    (
-                        eigenvalues,
-                        vert_structfunc,
-                    ) = VerticalStructureEquation.compute_baroclinicmodes(
-                        profile, grid_step, n_modes=n_modes
-                    )
-                    if bottom + 1 != flatten_array[i].shape[-1]:
-                        print(vert_structfunc.shape)
-                        vert_structfunc = np.append(
-                            vert_structfunc,
-                            np.nan
-                            * np.ones(
-                                ((flatten_array.shape[-1] - (bottom + 1),) + (n_modes,))
-                            ),
-                            axis=0,
-                        )
-                        print(vert_structfunc.shape)
-
-            except ValueError:
-                eigenvalues = np.full(n_modes, np.nan)
-                vert_structfunc = np.full_like(s_param.shape + (n_modes,), np.nan)
-            # Append eigenvals, vert_structfunc
-            eigenvals_list.append(eigenvalues)
-            vert_structfunc_list.append(vert_structfunc)
+        # Bottom depths as Python scalars (no numpy scalar conversion per profile).
+        flatten_bathy_array = np.asarray(bottom_depth).reshape(-1).tolist()
+        # Solve profiles concurrently: LAPACK eigensolvers release the GIL.
+        solve_profile = partial(
+            VerticalStructureEquation.__solve_profile,
+            grid_step=grid_step,
+            n_modes=n_modes,
+            rossbyrad_only=rossbyrad_only,
+        )
+        with ThreadPoolExecutor() as executor:
+            results = list(
+                tqdm(
+                    executor.map(solve_profile, flatten_array, flatten_bathy_array),
+                    total=flatten_array.shape[0],
+                )
+            )
+        eigenvals_list = [eigenvalues for eigenvalues, _ in results]
+        vert_structfunc_list = [vert_structfunc for _, vert_structfunc in results]
         # Compute rossby radii array and reshape
         eigenvals_array = np.array(eigenvals_list)
         rossby_rad = VerticalStructureEquation.compute_rossby_rad(eigenvals_array)
@@ -123,6 +103,50 @@ class VerticalStructureEquation:
         # Return rossby radii array and list of vert_struct_func
         return rossby_rad, vert_structfunc
 
+    @staticmethod
+    def __solve_profile(
+        profile: NDArray,
+        bottom: float,
+        grid_step: float,
+        n_modes: int,
+        rossbyrad_only: bool,
+    ) -> tuple[NDArray]:
+        """
+        Compute eigenvalues and vert. structure function of a single profile.
+        """
+
+        bottom = int(bottom)
+        full_length = profile.shape[-1]
+        profile = profile[: bottom + 1]
+        try:
+            if rossbyrad_only:
+                tridiagmatrix = VerticalStructureEquation.tridiag_matrix_standardprob(
+                    profile, dz=grid_step
+                )
+                eigenvalues, vert_structfunc = EigenProblem.tridiag_eigensolver(
+                    tridiagmatrix, n_modes, eigvals_only=rossbyrad_only
+                )
+            else:
+                (
+                    eigenvalues,
+                    vert_structfunc,
+                ) = VerticalStructureEquation.compute_baroclinicmodes(
+                    profile, grid_step, n_modes=n_modes
+                )
+                if bottom + 1 != full_length:
+                    vert_structfunc = np.append(
+                        vert_structfunc,
+                        np.nan * np.ones(((full_length - (bottom + 1),) + (n_modes,))),
+                        axis=0,
+                    )
+        except ValueError:
+            eigenvalues = np.full(n_modes, np.nan)
+            # Same shape as the (padded) results of the other profiles.
+            vert_structfunc = (
+                None if rossbyrad_only else np.full((full_length - 1, n_modes), np.nan)
+            )
+        return eigenvalues, vert_structfunc
+
     @staticmethod
     def compute_baroclinicmodes(
         s_param: NDArray,
@@ -144,6 +168,9 @@ class VerticalStructureEquation:
                                                         depending on 'vertvel_method')
         """
 
+        # Contiguous float64 profile (e.g. float32 or strided netCDF slices),
+        # so that LAPACK/ARPACK run double precision routines without copies.
+        s_param = np.ascontiguousarray(s_param, dtype=np.float64)
         # Number of vertical levels
         n_levels = s_param.shape[0]
         if grid_step is None:
@@ -198,9 +225,8 @@ class VerticalStructureEquation:
         Check if the eigenvectors have correct sign.
         """
 
-        for i in range(eigenvectors.shape[1]):
-            if eigenvectors[0, i] < 0:
-                eigenvectors[:, i] *= -1
+        # Flip (in place) the columns with negative surface value.
+        eigenvectors[:, eigenvectors[0] < 0] *= -1
         return eigenvectors
 
     @staticmethod
@@ -215,14 +241,15 @@ class VerticalStructureEquation:
         # Define integration constant phi_0 = phi(z = 0) = 1 as BC.
         phi_barotropic = 1
         phi_0 = np.ones(n_modes) * phi_barotropic
+        # Obtain Phi integrating eigenvectors * S (all modes at once):
+        # Phi(z_j) = phi_0 + integral of S * w over levels 0, ..., j-1 .
+        integral_argument = s_param[:, np.newaxis] * eigenvectors
+        cumulative_integral = sp.integrate.cumulative_trapezoid(
+            integral_argument, dx=dz, axis=0, initial=0
+        )
         vert_structfunc = np.empty_like(eigenvectors)
-        for i in range(n_modes):
-            # Obtain Phi integrating eigenvectors * S.
-            integral_argument = s_param * eigenvectors[:, i]
-            for j in range(vert_structfunc.shape[0]):
-                vert_structfunc[j, i] = (
-                    sp.integrate.trapezoid(integral_argument[:j], dx=dz) + phi_0[i]
-                )
+        vert_structfunc[0] = phi_0
+        vert_structfunc[1:] = cumulative_integral[:-1] + phi_0
         return vert_structfunc
 
     @staticmethod
@@ -255,38 +282,37 @@ class VerticalStructureEquation:
 
         # earth angular velocity (1/s)
         earth_angvel = 7.29 * 1e-05
-        # coriolis parameter (1/s)
-        coriolis_param = 2 * earth_angvel * np.sin(mean_lat * np.pi / 180)
+        # coriolis parameter (1/s); libm sin for scalar latitude.
+        if np.ndim(mean_lat) == 0:
+            coriolis_param = 2 * earth_angvel * math.sin(math.radians(mean_lat))
+        else:
+            coriolis_param = 2 * earth_angvel * np.sin(mean_lat * np.pi / 180)
         return coriolis_param
 
     @staticmethod
-    def tridiag_matrix_standardprob(s_param: NDArray, dz: float) -> NDArray:
+    def tridiag_matrix_standardprob(s_param: NDArray, dz: float) -> tuple[NDArray]:
         """
         Compute finite difference tridiagonal matrix corresponding to LHS matrix of STANDARD eigenproblem.
 
         :params s_param : S parameter BV freq**2 / coriolis_param**2
         :params dz : grid_step
+        :returns : main diagonal and off-diagonal of the (symmetric) tridiagonal matrix
         """
 
         S = s_param
         n = S.shape[0] - 1
-        M = np.zeros([n, n])
-
-        for k in range(2, n):
-            M[k - 1, k] = 1 / S[k] * (-1)
-            M[k - 1, k - 1] = (-1 / S[k - 1] - 1 / S[k]) * (-1)
-            M[k - 1, k - 2] = 1 / S[k - 1] * (-1)
-        # B.C.s
-        M[0, 0] = -1 / S[1] * (-1)
-        M[0, 1] = 1 / S[1] * (-1)
-        M[-1, -2] = 1 / S[-2] * (-1)
-        M[-1, -1] = -1 / S[-2] * (-1)
-
-        M *= 1 / (dz**2)
-        return M
+        # Inverse of S at inner levels, scaled by grid step (S[0], S[n] are not used).
+        inv_S = 1 / (S[1:n] * dz**2)
+        # Main diagonal (B.C.s at first and last rows) and symmetric off-diagonals.
+        main_diag = np.empty(n)
+        main_diag[0] = inv_S[0]
+        main_diag[1:-1] = inv_S[:-1] + inv_S[1:]
+        main_diag[-1] = inv_S[-1]
+        off_diag = -inv_S
+        return main_diag, off_diag
 
     @staticmethod
-    def lhs_matrix_generalizedprob(n: int, dz: float) -> NDArray:
+    def lhs_matrix_generalizedprob(n: int, dz: float) -> sp.sparse.csc_matrix:
         """
         Compute L.H.S. matrix in the GENERALIZED eigenvalues/eigenvectors problem.
 
@@ -299,16 +325,16 @@ class VerticalStructureEquation:
 
         Returns
         -------
-        A : <class 'numpy.ndarray'>
-            L.H.S. finite difference matrix
+        A : <class 'scipy.sparse.csc_matrix'>
+            L.H.S. finite difference matrix (with changed sign, i.e. -d^2/dz^2)
 
                         | 0      0    0     0   . . . . .  0 |
-                        | 12    -24   12     0   . . . . . 0 |
-                        | -1    16   -30    16  -1  0 . .  0 |
-        A = (1/12dz^2) * | .     -1    16  -30   16  -1  .  0 |
+                        | -12    24  -12     0   . . . . . 0 |
+                        | 1    -16    30   -16   1  0 . .  0 |
+        A = (1/12dz^2) * | .      1   -16   30  -16   1  .  0 |
                         | .        .      .   .     .    .   |
-                        | .       0   -1    16  -30   16  -1 |
-                        | .            0    0    12  -24  12 |
+                        | .       0    1   -16   30  -16   1 |
+                        | .            0    0   -12   24  -12 |
                         | 0      0    0     0   . . . . .  0 |
 
         where dz is the grid step (= 1m).
@@ -316,31 +342,34 @@ class VerticalStructureEquation:
         last lines of A = 0.
         """
 
-        # Create matrix (only null values).
-        A = np.zeros([n, n])  # finite difference matrix.
-        # Fill matrix with values (centered finite difference).
-        for i in range(3, n - 1):
-            A[i - 1, i - 3] = -1 / (12 * dz**2)
-            A[i - 1, i - 2] = 16 / (12 * dz**2)
-            A[i - 1, i - 1] = -30 / (12 * dz**2)
-            A[i - 1, i] = 16 / (12 * dz**2)
-            A[i - 1, i + 1] = -1 / (12 * dz**2)
-        # Set Boundary Conditions.
-        A[1, 0] = 1 / (dz**2)
-        A[1, 1] = -2 / (dz**2)
-        A[1, 2] = 1 / (dz**2)
-        A[n - 2, n - 1] = 1 / (dz**2)
-        A[n - 2, n - 2] = -2 / (dz**2)
-        A[n - 2, n - 3] = 1 / (dz**2)
-        # Delete BCs rows which may be not considered.
-        A = np.delete(A, n - 1, axis=0)
-        A = np.delete(A, 0, axis=0)
-        A = np.delete(A, n - 1, axis=1)
-        A = np.delete(A, 0, axis=1)
+        # Sparse banded matrix, without BCs rows/columns (first and last).
+        m = n - 2
+        coeff = 1 / (12 * dz**2)
+        # Fill diagonals with values (centered finite difference), on inner rows.
+        main_diag = np.full(m, 30 * coeff)
+        upper_diag = np.full(m - 1, -16 * coeff)
+        lower_diag = np.full(m - 1, -16 * coeff)
+        upper_diag_2 = np.full(m - 2, coeff)
+        lower_diag_2 = np.full(m - 2, coeff)
+        # Set Boundary Conditions (first and last rows).
+        # Diagonals may be empty for the smallest grids (e.g. n = 4).
+        main_diag[[0, -1]] = 2 / (dz**2)
+        if m > 1:
+            upper_diag[0] = -1 / (dz**2)
+            lower_diag[-1] = -1 / (dz**2)
+        if m > 2:
+            upper_diag_2[0] = 0
+            lower_diag_2[-1] = 0
+        A = sp.sparse.diags(
+            [lower_diag_2, lower_diag, main_diag, upper_diag, upper_diag_2],
+            [-2, -1, 0, 1, 2],
+            shape=(m, m),
+            format="csc",
+        )
         return A
 
     @staticmethod
-    def rhs_matrix_generalizedprob(s_param: NDArray) -> NDArray:
+    def rhs_matrix_generalizedprob(s_param: NDArray) -> sp.sparse.csc_matrix:
         """
         Comput R.H.S. matrix in the GENERALIZED eigenvalues/eigenvectors problem.
 
@@ -351,36 +380,22 @@ class VerticalStructureEquation:
 
         Returns
         -------
-        B : <class 'numpy.ndarray'>
-            R.H.S. S-depending matrix
+        B : <class 'scipy.sparse.csc_matrix'>
+            R.H.S. S-depending matrix (with changed sign, as A)
 
-                        | -S_0    0    0     . . .   0 |
-                        | 0     -S_1   0     0   . . 0 |
-                        | 0      0   -S_2    0 . . . 0 |
+                        | S_0    0    0     . . .   0 |
+                        | 0     S_1   0     0   . . 0 |
+                        | 0      0   S_2    0 . . . 0 |
         B =              | .      0     0     .       . |
                         | .        .      .      .   . |
-                        | .          0     0      -S_n |
+                        | .          0     0       S_n |
 
         where dz is the grid step (= 1m).
         """
 
         S = s_param
-        n = S.shape[0]
-        # Create matrix (only null values).
-        B = np.zeros([n, n])  # right side S-depending matrix.
-        # Fill matrix with values (S).
-        for i in range(3, n - 1):
-            B[i - 1, i - 1] = -S[i - 1]
-        # Set Boundary Conditions.
-        B[0, 0] = -S[0]  # first row
-        B[1, 1] = -S[1]
-        B[n - 1, n - 1] = -S[n - 1]  # last row
-        B[n - 2, n - 2] = -S[n - 2]  # last row
-        # Delete BCs rows which may be not considered.
-        B = np.delete(B, n - 1, axis=0)
-        B = np.delete(B, 0, axis=0)
-        B = np.delete(B, n - 1, axis=1)
-        B = np.delete(B, 0, axis=1)
+        # Sparse diagonal matrix of S, with BCs rows/columns (first and last) removed.
+        B = sp.sparse.diags(S[1:-1], format="csc")
         return B
 
 
@@ -389,7 +404,7 @@ if __name__ == "__main__":
     # -----------------------------
     #  Testing _compute_matrix_A() of generalized problem
     # -----------------------------
-    A = (1 / (12 * dz**2)) * np.array(
+    A = -(1 / (12 * dz**2)) * np.array(
         [
             [-24, 12, 0, 0, 0, 0],
             [16, -30, 16, -1, 0, 0],
@@ -400,15 +415,19 @@ if __name__ == "__main__":
         ]
     )
     computed_A = VerticalStructureEquation.lhs_matrix_generalizedprob(8, dz)
-    assert np.allclose(A, computed_A)
+    assert np.allclose(A, computed_A.toarray())
+    # Minimal grid (two inner levels): only the BCs rows are left.
+    A_min = (1 / dz**2) * np.array([[2, -1], [-1, 2]])
+    computed_A_min = VerticalStructureEquation.lhs_matrix_generalizedprob(4, dz)
+    assert np.allclose(A_min, computed_A_min.toarray())
     # -----------------------------
     #  Testing _compute_matrix_B() of generalized problem
     # -----------------------------
     n = 1000
     S = np.arange(n)
-    B = np.diag(-S[1:-1])
+    B = np.diag(S[1:-1])
     computed_B = VerticalStructureEquation.rhs_matrix_generalizedprob(S)
-    assert np.allclose(B, computed_B)
+    assert np.allclose(B, computed_B.toarray())
 
     # Test eigenvalues for nondim constant profile
     n_modes = 3
@@ -442,7 +461,8 @@ if __name__ == "__main__":
     N_const_3d[3, 5] *= 2
     N_const_1d = np.ones(bottom_depth + 1) * 2
     mean_lat_1d = 1
-    mean_lat_3d = np.ones_like(N_const_3d)
+    # Constant latitude as a zero-stride (read-only) view, not a full 3D array.
+    mean_lat_3d = np.broadcast_to(1.0, N_const_3d.shape)
     bottom_depth_1d = np.full_like(N_const_1d, bottom_depth)
     bottom_depth_3d = np.full_like(N_const_3d[:, :, 0], bottom_depth)
     bottom_depth_3d[10, 15] /= 2
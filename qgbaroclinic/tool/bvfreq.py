@@ -23,7 +23,9 @@ class BVfreq:
         self.bv_freq = np.sqrt(self.compute_bvfreq_sqrd(depth, density))
 
     @staticmethod
-    def compute_bvfreq_sqrd(depth: NDArray, density: NDArray) -> NDArray:
+    def compute_bvfreq_sqrd(
+        depth: NDArray, density: NDArray, depth_is_positive: bool = False
+    ) -> NDArray:
         """
         Compute Brunt-Vaisala frequency from depth and density.
 
@@ -34,6 +36,8 @@ class BVfreq:
         mean_density : <class 'numpy.ndarray'>
             mean density vertical profile [kg/(m^3)],
             defined on z grid
+        depth_is_positive : 'bool'
+            if depth is already given as positive values (skips sign check)
         Returns
         -------
         bvfreq : <class 'numpy.ndarray'>
@@ -50,18 +54,25 @@ class BVfreq:
         ** while derivatives are computed at interfaces 1/2, ... k+1/2, ... N+1/2 **
         """
 
-        # Take absolute value of depth with neg sign.
-        # Only if values are all positive or all negative.
-        if np.all(np.sign(depth) < 0) or np.all(np.sign(depth) > 0):
-            depth = np.abs(depth)
+        # Work on raw numpy arrays (no per-operation xarray wrapping).
+        depth = np.asarray(depth)
+        # Depth-innermost C-contiguous profiles, so that vertical differences
+        # are stride-1 (transposed or strided views are copied once).
+        density = np.ascontiguousarray(density)
+        # Take absolute value of depth with neg sign, only if values are all negative
+        # (all positive values are kept as they are, without copying the array).
+        if not depth_is_positive and np.max(depth) < 0:
+            depth = np.negative(depth)
         # Defining value of gravitational acceleration.
         g = 9.806  # (m/s^2)
         # Defining value of reference density rho_0.
         rho_0 = 1025.0  # (kg/m^3)
-        # Compute Brunt-Vaisala frequency
-        dz = depth[..., 1:] - depth[..., :-1]
-        density_diff = density[..., 1:] - density[..., :-1]
-        bvfreq_sqrd = (g / rho_0) * density_diff / dz
+        # Compute Brunt-Vaisala frequency (in place, without temporary arrays).
+        dz = np.diff(depth, axis=-1) * (rho_0 / g)
+        bvfreq_sqrd = np.diff(density, axis=-1).astype(
+            np.result_type(density, dz), copy=False
+        )
+        np.divide(bvfreq_sqrd, dz, out=bvfreq_sqrd)
         return bvfreq_sqrd
 
     @staticmethod
@@ -70,11 +81,11 @@ class BVfreq:
         Remove negative values and re-interpolate the profile (considering starting equally spaced grid).
         """
 
-        # Remove possible negative values
-        new_arr = np.copy(bv_freq_sqrd)
-        new_arr[np.where(new_arr < 0)] = np.nan
+        # Remove possible negative values (single pass, boolean mask).
+        new_arr = np.where(bv_freq_sqrd < 0, np.nan, bv_freq_sqrd)
         arr_len = bv_freq_sqrd.shape[-1]
-        depth = np.arange(0, arr_len)
+        # Float grid: not re-cast by np.interp for each interpolated profile.
+        depth = np.arange(arr_len, dtype=np.float64)
         interpolation = Interpolation(depth, new_arr)
         (interp_arr,) = interpolation.apply_interpolation(
             start=0, stop=depth[-1], step=grid_step, return_depth=False
@@ -105,16 +116,30 @@ if __name__ == "__main__":
     coeff = 10  # kg/m^3
     g = 9.806  # (m/s^2)
     linear_density = coeff * depth / H + rho_0
-    expected_bvfreqsqrd_linear = ((g * coeff) / (H * rho_0)) * np.ones(len_int)
+    expected_bvfreqsqrd_linear = np.full(len_int, (g * coeff) / (H * rho_0))
     # Case EXPON rho(z) = rho_0 * exp(a*z/H), z < 0 --> N^2 = g*a*exp(a*z)/H
     coeff = 0.01  # kg/m^3
     expon_density = rho_0 * np.exp(coeff * depth / H)
     expected_bvfreqsqrd_expon = g * coeff * (1 / H) * np.exp(coeff * interface / H)
 
-    # Numerical results.
-    result_const = BVfreq.compute_bvfreq_sqrd(depth, const_density)
-    result_linear = BVfreq.compute_bvfreq_sqrd(depth, linear_density)
-    result_expon = BVfreq.compute_bvfreq_sqrd(depth, expon_density)
+    # Theoretical cases, stacked once as rows (profiles) and shared by all checks.
+    density_array = np.array([const_density, linear_density, expon_density])
+    expected_array = np.array(
+        [
+            expected_bvfreqsqrd_const,
+            expected_bvfreqsqrd_linear,
+            expected_bvfreqsqrd_expon,
+        ]
+    )
+    print(f"Multidim density array has shape: {density_array.shape}")
+    # Numerical results (all cases at once).
+    new_result = BVfreq.compute_bvfreq_sqrd(depth, density_array)
+    print(f"Multidim BVfreq has shape: {new_result.shape}")
+    result_const, result_linear, result_expon = new_result
+    # Single profiles give the same result as stacked ones.
+    assert np.array_equal(
+        BVfreq.compute_bvfreq_sqrd(depth, linear_density), result_linear
+    )
     assert np.allclose(result_const, expected_bvfreqsqrd_const)
     assert np.allclose(result_linear, expected_bvfreqsqrd_linear, rtol=1e-02)
     print(
@@ -125,22 +150,9 @@ if __name__ == "__main__":
     print(
         f"For EXPON case, relative error is of order {np.mean((np.abs(result_expon - expected_bvfreqsqrd_expon)/expected_bvfreqsqrd_expon))}"
     )
-    # Test if the computation works for arrays of density profiles
-    density_array = np.array([const_density, linear_density, expon_density])
-    print(f"Multidim density array has shape: {density_array.shape}")
-    new_result = BVfreq.compute_bvfreq_sqrd(depth, density_array)
-    print(f"Multidim BVfreq has shape: {new_result.shape}")
-    expected_array = np.array(
-        [
-            expected_bvfreqsqrd_const,
-            expected_bvfreqsqrd_linear,
-            expected_bvfreqsqrd_expon,
-        ]
-    )
     assert np.allclose(new_result, expected_array, rtol=1e-02)
     print("Multidim result has expected accuracy.")
-    # Test with 3D array
-    density_array = np.array([const_density, linear_density, expon_density])
+    # Test with 3D array (view of the 2D one, no new array is built)
     density_3d = density_array.reshape((1, 3, len_z))
     assert np.array_equal(density_3d[0, 1, :], linear_density)
     assert np.array_equal(density_3d[0, 2, :], expon_density)
@@ -1,5 +1,230 @@
+from numbers import Number
+import threading
 import numpy as np
+from numba import njit, prange, vectorize
+from numba.extending import register_jitable
 from numpy.typing import NDArray
+import xarray as xr
+import dask
+import dask.array as da
+
+# xarray types whose data are unwrapped before evaluating the EoS kernels.
+XR_TYPES = (xr.DataArray, xr.Variable)
+
+# Temperature polynomial coefficients (increasing degree) of the Eq. of Seawater,
+# from Jackett and McDougall (1995, Table A1).
+# rho(sal, temp, 0) = rho_0 + A*sal + B*sal^3/2 + C*sal^2
+RHO_0_COEFFS = np.array(
+    [999.842594, 6.793952e-2, -9.095290e-3, 1.001685e-4, -1.120083e-6, 6.536336e-9]
+)
+RHO_A_COEFFS = np.array([0.824493, -4.0899e-3, 7.6438e-5, -8.2467e-7, 5.3875e-9])
+RHO_B_COEFFS = np.array([-5.72466e-3, 1.0227e-4, -1.6546e-6])
+RHO_C = 4.8314e-4
+# K_0 = Kw_0 + a*sal + b*sal^3/2
+KW_0_COEFFS = np.array(
+    [1.965933e04, 1.444304e02, -1.706103, 9.648704e-03, -4.190253e-05]
+)
+K_0_A_COEFFS = np.array([5.284855e01, -3.101089e-01, 6.283263e-03, -5.084188e-05])
+K_0_B_COEFFS = np.array([3.886640e-01, 9.085835e-03, -4.619924e-04])
+# A = Aw + c*sal + d*sal^3/2
+AW_COEFFS = np.array([3.186519, 2.212276e-02, -2.984642e-04, 1.956415e-06])
+A_C_COEFFS = np.array([6.704388e-03, -1.847318e-04, 2.059331e-07])
+A_D = 1.480266e-04
+# B = Bw + e*sal
+BW_COEFFS = np.array([2.102898e-04, -1.202016e-05, 1.394680e-07])
+B_E_COEFFS = np.array([-2.040237e-06, 6.128773e-08, 6.207323e-10])
+
+# Columns evaluated by each task of the compiled kernels (contiguous inner loops).
+COL_BLOCK = 4096
+
+# Scalar/element-wise kernels shared by the EoS methods and by compiled loops.
+# They are kept at module level, so that numba can resolve them within
+# nopython mode, while still working with array-like (e.g. xarray) inputs.
+
+
+@register_jitable(fastmath=True)
+def _estrin(temp: float, temp_2: float, temp_4: float, coeffs: NDArray) -> float:
+    """
+    Evaluate polynomial in temp (coefficients of increasing degree, up to 5),
+    following Estrin's scheme:
+
+        (c0 + c1*temp) + (c2 + c3*temp)*temp^2 + (c4 + c5*temp)*temp^4 .
+
+    Powers of temp are given, so that they are shared among polynomials.
+    """
+
+    n = len(coeffs)
+    result = coeffs[0] + coeffs[1] * temp
+    if n > 3:
+        result = result + (coeffs[2] + coeffs[3] * temp) * temp_2
+    elif n > 2:
+        result = result + coeffs[2] * temp_2
+    if n > 5:
+        result = result + (coeffs[4] + coeffs[5] * temp) * temp_4
+    elif n > 4:
+        result = result + coeffs[4] * temp_4
+    return result
+
+
+@register_jitable(fastmath=True)
+def _adiabtempgrad(sal: float, temp: float, press: float) -> float:
+    """
+    Adiabatic lapse rate, from UNESCO (1983). See EoS.__adiabtempgrad.
+    """
+
+    DS = sal - 35.0
+    ATG = (
+        (
+            ((-2.1687e-16 * temp + 1.8676e-14) * temp - 4.6206e-13) * press
+            + (
+                (2.7759e-12 * temp - 1.1351e-10) * DS
+                + ((-5.4481e-14 * temp + 8.733e-12) * temp - 6.7795e-10) * temp
+                + 1.8741e-8
+            )
+        )
+        * press
+        + (-4.2393e-8 * temp + 1.8932e-6) * DS
+        + ((6.6228e-10 * temp - 6.836e-8) * temp + 8.5258e-6) * temp
+        + 3.5803e-5
+    )
+    return ATG
+
+
+@register_jitable(fastmath=True)
+def _potential_temperature(
+    sal: float, temp: float, press: float, ref_press: float
+) -> float:
+    """
+    Potential temperature, from UNESCO (1983). See EoS.potential_temperature.
+    """
+
+    H = ref_press - press
+    XK = H * _adiabtempgrad(sal, temp, press)
+    temp = temp + 0.5 * XK
+    Q = XK
+    press = press + 0.5 * H
+    XK = H * _adiabtempgrad(sal, temp, press)
+    temp = temp + 0.29289322 * (XK - Q)
+    Q = 0.58578644 * XK + 0.121320344 * Q
+    XK = H * _adiabtempgrad(sal, temp, press)
+    temp = temp + 1.707106781 * (XK - Q)
+    Q = 3.414213562 * XK - 4.121320344 * Q
+    press = press + 0.5 * H
+    XK = H * _adiabtempgrad(sal, temp, press)
+    THETA = temp + (XK - 2.0 * Q) / 6.0
+    return THETA
+
+
+@register_jitable(fastmath=True)
+def _rho_term(S: float, T: float, T2: float, T4: float, SR: float) -> float:
+    """
+    rho = rho_0 + A*sal + B*sal^3/2 + C*sal^2 . See EoS.__compute_rho.
+    """
+
+    return (
+        _estrin(T, T2, T4, RHO_0_COEFFS)
+        + (
+            _estrin(T, T2, T4, RHO_A_COEFFS)
+            + _estrin(T, T2, T4, RHO_B_COEFFS) * SR
+            + RHO_C * S
+        )
+        * S
+    )
+
+
+@register_jitable(fastmath=True)
+def _K_0_term(S: float, T: float, T2: float, T4: float, SR: float) -> float:
+    """
+    K_0 = Kw_0 + a*sal + b*sal^3/2 . See EoS.__compute_K_0.
+    """
+
+    return (
+        _estrin(T, T2, T4, KW_0_COEFFS)
+        + (_estrin(T, T2, T4, K_0_A_COEFFS) + _estrin(T, T2, T4, K_0_B_COEFFS) * SR) * S
+    )
+
+
+@register_jitable(fastmath=True)
+def _A_term(S: float, T: float, T2: float, T4: float, SR: float) -> float:
+    """
+    A = Aw + c*sal + d*sal^3/2 . See EoS.__compute_A.
+    """
+
+    return (
+        _estrin(T, T2, T4, AW_COEFFS) + (_estrin(T, T2, T4, A_C_COEFFS) + A_D * SR) * S
+    )
+
+
+@register_jitable(fastmath=True)
+def _B_term(S: float, T: float, T2: float, T4: float) -> float:
+    """
+    B = Bw + e*sal . See EoS.__compute_B.
+    """
+
+    return _estrin(T, T2, T4, BW_COEFFS) + _estrin(T, T2, T4, B_E_COEFFS) * S
+
+
+@register_jitable(fastmath=True)
+def _density(S: float, T: float, press: float) -> float:
+    """
+    Density from salinity and potential temperature, pressure in [bar].
+    See EoS.compute_density.
+    """
+
+    SR = np.sqrt(S)
+    T2 = T * T
+    T4 = T2 * T2
+    rho = _rho_term(S, T, T2, T4, SR)
+    K_0 = _K_0_term(S, T, T2, T4, SR)
+    A = _A_term(S, T, T2, T4, SR)
+    B = _B_term(S, T, T2, T4)
+    # density = rho/[1 - press/K]
+    return rho / (1.0 - press / (K_0 + press * (A + press * B)))
+
+
+@register_jitable(fastmath=True)
+def _freshwater_density(T: float, press: float) -> float:
+    """
+    Density of pure water (zero salinity), pressure in [bar].
+    See EoS.compute_density.
+    """
+
+    T2 = T * T
+    T4 = T2 * T2
+    rho = _estrin(T, T2, T4, RHO_0_COEFFS)
+    K_0 = _estrin(T, T2, T4, KW_0_COEFFS)
+    A = _estrin(T, T2, T4, AW_COEFFS)
+    B = _estrin(T, T2, T4, BW_COEFFS)
+    return rho / (1.0 - press / (K_0 + press * (A + press * B)))
+
+
+@register_jitable
+def _accumulate_density(
+    sal: NDArray,
+    temp: NDArray,
+    press: float,
+    rows: range,
+    sums: NDArray,
+    counts: NDArray,
+) -> None:
+    """
+    Add (non-NaN) density values of the given rows to column-wise sums and counts,
+    pressure in [bar]. See EoS.mean_density_profile.
+    """
+
+    for j in rows:
+        for k in range(sal.shape[1]):
+            # Skip missing values (checked on inputs, as density
+            # is evaluated with fast-math flags).
+            if np.isnan(sal[j, k]) or np.isnan(temp[j, k]):
+                continue
+            sums[k] += _density(sal[j, k], temp[j, k], press)
+            counts[k] += 1
+
+
+# Fallback for other array-like objects: the fused EoS as a (lazily compiled)
+# ufunc, which is specialized on the input types at first call.
+_density_ufunc = vectorize(fastmath=True, cache=True)(_density)
 
 
 class EoS:
@@ -20,12 +245,12 @@ class EoS:
             sea water potential temperature [°C]
         sal : <numpy.ndarray>
             sea water salinity [PSU]
-        ref_press : <numpy.ndarray>
-            reference pressure in [dbars]. Default to 0
+        ref_press : float
+            reference pressure in [dbars] (scalar). Default to 0
 
         Raise
         ------
-        ValueError if pot_temp and sal has different shapes
+        ValueError if pot_temp and sal shapes can not be broadcast together
 
         Returns
         -------
@@ -48,53 +273,161 @@ class EoS:
               McDougall's coefficients.
         """
 
-        # Pressure conversion from [dbar] to [bar]
-        ref_press /= 10
-        # ==================================================================
-        # Compute reference density at atmospheric pressure
-        #
-        #   rho = rho(sal, temp, 0) = rho_0 + A*sal + B*sal^3/2 + C*sal^2 .
-        #
-        # Notation follows 'International one-atmosphere equation of state
-        # of seawater' (Millero and Poisson, 1981).
-        # ==================================================================
-
-        rho = EoS.__compute_rho(sal, pot_temp)
-
-        # ==================================================================
-        # Compute coefficients in the bulk modulus of seawater expression
-        #
-        #   K(sal, temp, p) = K_0 + Ap + Bp^2 , with K_0 = K(sal, temp, 0) .
-        #
-        # Each term is composed by a pure water term (subscript 'w') and
-        # others involving pot. temperature and salinity:
-        #   K_0 = Kw_0 + a*sal + b*sal^3/2
-        #   A = Aw + c*sal + d*sal^3/2
-        #   B = Bw + e*sal
-        # Notation follows 'A new high pressure equation of state for
-        # seawater' (Millero et al, 1980).
-        # ==================================================================
-
-        # Bulk modulus of seawater at atmospheric pressure.
-        K_0 = EoS.__compute_K_0(sal, pot_temp)
-        # Compression term coefficients.
-        A = EoS.__compute_A(sal, pot_temp)
-        B = EoS.__compute_B(sal, pot_temp)
-
-        # ==================================================================
-        # Compute IN SITU DENSITY IN TERMS OF DEPTH. The above
-        # coeffients of terms in K(sal, temp, p) have been modified
-        # consistently with Jackett and McDougall (1994).
-        #
-        #   density(sal, temp, press) = rho/[1 - press/K(sal, temp, press)]
-        #                       = rho/[1 - press/(K_0 + (A*press + B*press^2))]
-        # ==================================================================
-
-        density = rho / (1.0 - ref_press / (K_0 + ref_press * (A + ref_press * B)))
+        # xarray objects: run the kernel on the underlying (numpy or dask) data.
+        if isinstance(sal, XR_TYPES) or isinstance(pot_temp, XR_TYPES):
+            return xr.apply_ufunc(
+                EoS.compute_density,
+                sal,
+                pot_temp,
+                ref_press,
+                dask="parallelized",
+                output_dtypes=[
+                    np.result_type(
+                        *(getattr(arg, "dtype", np.float64) for arg in (sal, pot_temp)),
+                        np.float32,
+                    )
+                ],
+            )
+        # dask arrays: evaluate the fused kernel block by block.
+        if isinstance(sal, da.Array) or isinstance(pot_temp, da.Array):
+            # Blocks of both arguments should match (e.g. numpy with dask input).
+            sal, pot_temp = da.broadcast_arrays(sal, pot_temp)
+            index = tuple(range(sal.ndim))
+            _, (sal, pot_temp) = da.core.unify_chunks(sal, index, pot_temp, index)
+            return da.map_blocks(
+                EoS.compute_density,
+                sal,
+                pot_temp,
+                ref_press,
+                dtype=np.result_type(
+                    *(getattr(arg, "dtype", np.float64) for arg in (sal, pot_temp)),
+                    np.float32,
+                ),
+            )
+        # Pressure conversion from [dbar] to [bar] (scalar constant).
+        ref_press = float(ref_press) * 0.1
+        # Plain numpy inputs: evaluate the whole EoS in a single compiled pass.
+        if isinstance(sal, (np.ndarray, Number)) and isinstance(
+            pot_temp, (np.ndarray, Number)
+        ):
+            # Fresh water (zero salinity): only pure water terms are evaluated.
+            if np.ndim(sal) == 0 and sal == 0:
+                pot_temp = np.asarray(pot_temp)
+                dtype = np.result_type(pot_temp.dtype, np.float32)
+                density = np.empty(pot_temp.shape, dtype=dtype)
+                freshwater_kernel = (
+                    EoS.__freshwater_kernel
+                    if EoS.__use_threads()
+                    else EoS.__freshwater_serial_kernel
+                )
+                freshwater_kernel(
+                    np.ravel(pot_temp).astype(dtype, copy=False),
+                    ref_press,
+                    density.reshape(-1),
+                )
+                return density[()]
+            sal, pot_temp = np.asarray(sal), np.asarray(pot_temp)
+            # Single precision inputs (memory-bound grids) give single precision output.
+            dtype = np.result_type(sal.dtype, pot_temp.dtype, np.float32)
+            sal = sal.astype(dtype, copy=False)
+            pot_temp = pot_temp.astype(dtype, copy=False)
+            # Shapes are validated (and broadcast) only if they differ:
+            # raise ValueError if they can not be broadcast together.
+            # Broadcast arrays are read-only views, which are never materialized.
+            if sal.shape != pot_temp.shape:
+                shape = np.broadcast_shapes(sal.shape, pot_temp.shape)
+                sal = np.broadcast_to(sal, shape)
+                pot_temp = np.broadcast_to(pot_temp, shape)
+            density = np.empty(sal.shape, dtype=dtype)
+            density_kernel = (
+                EoS.__density_kernel
+                if EoS.__use_threads()
+                else EoS.__density_serial_kernel
+            )
+            density_kernel(
+                EoS.__as_rows(sal),
+                EoS.__as_rows(pot_temp),
+                ref_press,
+                EoS.__as_rows(density),
+            )
+            return density[()]
+        # Otherwise (e.g. other array-like objects) broadcast the fused EoS.
+        density = _density_ufunc(np.asanyarray(sal), np.asanyarray(pot_temp), ref_press)
 
         # Return density array.
         return density
 
+    @staticmethod
+    def mean_density_profile(
+        sal: NDArray, pot_temp: NDArray, ref_press: float = 0, axis: int = -1
+    ) -> NDArray:
+        """
+        Mean density over all axes except 'axis' (e.g. mean vertical profile),
+        ignoring NaNs. Density is computed and averaged in a single pass,
+        without storing the whole density field.
+
+        NOTE: pressure is expressed in dbar.
+        """
+
+        # xarray objects: work on the underlying (numpy or dask) data.
+        if isinstance(sal, XR_TYPES):
+            sal = sal.data
+        if isinstance(pot_temp, XR_TYPES):
+            pot_temp = pot_temp.data
+        # dask arrays: lazy reduction, running the fused kernel block by block
+        # (no density block is stored), then merging partial sums and counts.
+        if isinstance(sal, da.Array) or isinstance(pot_temp, da.Array):
+            sal, pot_temp = da.broadcast_arrays(sal, pot_temp)
+            # Whole profiles within each block (usually already a single chunk).
+            sal = da.moveaxis(sal, axis, -1).rechunk({sal.ndim - 1: -1})
+            pot_temp = da.moveaxis(pot_temp, axis, -1).rechunk(sal.chunks)
+            partial_sums = [
+                dask.delayed(EoS.__density_sums)(sal_block, temp_block, ref_press)
+                for sal_block, temp_block in zip(
+                    sal.to_delayed().flat, pot_temp.to_delayed().flat
+                )
+            ]
+            mean = dask.delayed(EoS.__mean_from_sums)(partial_sums)
+            return da.from_delayed(mean, shape=sal.shape[-1:], dtype=np.float64)
+        sal, pot_temp = np.asarray(sal), np.asarray(pot_temp)
+        shape = np.broadcast_shapes(sal.shape, pot_temp.shape)
+        sal, pot_temp = np.broadcast_to(sal, shape), np.broadcast_to(pot_temp, shape)
+        sums = EoS.__density_sums(
+            np.moveaxis(sal, axis, -1), np.moveaxis(pot_temp, axis, -1), ref_press
+        )
+        return EoS.__mean_from_sums([sums])
+
+    @staticmethod
+    def __density_sums(sal: NDArray, pot_temp: NDArray, ref_press: float) -> NDArray:
+        """
+        Sums and counts of (non-NaN) density values along the last axis,
+        stacked in a (2, n_levels) array. NOTE: pressure is expressed in dbar.
+        """
+
+        # Reduce along rows (broadcast views are copied only if their axes
+        # can not be merged).
+        sal = EoS.__as_rows(np.asarray(sal))
+        pot_temp = EoS.__as_rows(np.asarray(pot_temp))
+        # Blocks of dask arrays are reduced by worker threads (serial kernel).
+        density_sums_kernel = (
+            EoS.__density_sums_kernel
+            if EoS.__use_threads()
+            else EoS.__density_sums_serial_kernel
+        )
+        # Pressure conversion from [dbar] to [bar] (scalar constant).
+        return density_sums_kernel(sal, pot_temp, float(ref_press) * 0.1)
+
+    @staticmethod
+    def __mean_from_sums(partial_sums: list[NDArray]) -> NDArray:
+        """
+        Merge partial (2, n_levels) sums and counts into the mean profile.
+        """
+
+        sums, counts = np.sum(partial_sums, axis=0)
+        mean = np.full(sums.shape, np.nan)
+        np.divide(sums, counts, out=mean, where=counts > 0)
+        return mean
+
     @staticmethod
     def potential_temperature(
         sal: float, temp: float, press: float, ref_press: float = 0
@@ -106,21 +439,68 @@ class EoS:
         NOTE: pressure is expressed in [dbar]
         """
 
-        H = ref_press - press
-        XK = H * EoS.__adiabtempgrad(sal, temp, press)
-        temp = temp + 0.5 * XK
-        Q = XK
-        press = press + 0.5 * H
-        XK = H * EoS.__adiabtempgrad(sal, temp, press)
-        temp = temp + 0.29289322 * (XK - Q)
-        Q = 0.58578644 * XK + 0.121320344 * Q
-        XK = H * EoS.__adiabtempgrad(sal, temp, press)
-        temp = temp + 1.707106781 * (XK - Q)
-        Q = 3.414213562 * XK - 4.121320344 * Q
-        press = press + 0.5 * H
-        XK = H * EoS.__adiabtempgrad(sal, temp, press)
-        THETA = temp + (XK - 2.0 * Q) / 6.0
-        return THETA
+        # xarray objects: run the kernel on the underlying (numpy or dask) data.
+        if any(isinstance(arg, XR_TYPES) for arg in (sal, temp, press)):
+            return xr.apply_ufunc(
+                EoS.potential_temperature,
+                sal,
+                temp,
+                press,
+                ref_press,
+                dask="parallelized",
+                output_dtypes=[
+                    np.result_type(
+                        *(
+                            getattr(arg, "dtype", np.float64)
+                            for arg in (sal, temp, press)
+                        ),
+                        np.float32,
+                    )
+                ],
+            )
+        # Plain numpy inputs: integrate each point within a compiled loop.
+        if (
+            isinstance(sal, (np.ndarray, Number))
+            and isinstance(temp, (np.ndarray, Number))
+            and isinstance(press, (np.ndarray, Number))
+            and np.ndim(ref_press) == 0
+        ):
+            # Single precision inputs (memory-bound grids) give single precision output.
+            dtype = np.result_type(
+                np.asarray(sal).dtype,
+                np.asarray(temp).dtype,
+                np.asarray(press).dtype,
+                np.float32,
+            )
+            # Raise ValueError if shapes can not be broadcast together.
+            # Broadcast arrays (e.g. 1D pressure) are views, never materialized.
+            sal, temp, press = (
+                np.asarray(sal, dtype=dtype),
+                np.asarray(temp, dtype=dtype),
+                np.asarray(press, dtype=dtype),
+            )
+            shape = np.broadcast_shapes(sal.shape, temp.shape, press.shape)
+            sal, temp, press = (
+                np.broadcast_to(sal, shape),
+                np.broadcast_to(temp, shape),
+                np.broadcast_to(press, shape),
+            )
+            theta = np.empty(sal.shape, dtype=dtype)
+            pottemp_kernel = (
+                EoS.__pottemp_kernel
+                if EoS.__use_threads()
+                else EoS.__pottemp_serial_kernel
+            )
+            pottemp_kernel(
+                EoS.__as_rows(sal),
+                EoS.__as_rows(temp),
+                EoS.__as_rows(press),
+                float(ref_press),
+                EoS.__as_rows(theta),
+            )
+            return theta[()]
+        # Otherwise (e.g. dask arrays) keep element-wise operators.
+        return _potential_temperature(sal, temp, press, ref_press)
 
     @staticmethod
     def press2depth(press: float, latitude: float) -> float:
@@ -147,7 +527,173 @@ class EoS:
         return depth
 
     @staticmethod
-    def __compute_rho(sal: float, temp: float) -> float:
+    def __as_rows(array: NDArray) -> NDArray:
+        """
+        2D (rows, last axis) view of an array, for the compiled kernels.
+        Broadcast (zero-stride) axes are merged without being materialized.
+        """
+
+        n_rows = int(np.prod(array.shape[:-1]))
+        return array.reshape(n_rows, array.shape[-1] if array.ndim else 1)
+
+    @staticmethod
+    def __use_threads() -> bool:
+        """
+        Parallel (prange) kernels are run from the main thread only: numba threads
+        nested within other threads (e.g. dask workers) may hang at exit with
+        some threading layers (TBB). Other threads run the serial kernels.
+        """
+
+        return threading.current_thread() is threading.main_thread()
+
+    @staticmethod
+    @njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+    def __density_kernel(
+        sal: NDArray, temp: NDArray, press: float, out: NDArray
+    ) -> NDArray:
+        """
+        Compiled evaluation of the Eq. of Seawater, writing density into 'out'.
+
+        Same equations as __compute_rho, __compute_K_0, __compute_A, __compute_B,
+        evaluated point by point on 2D (rows, columns) views,
+        so that no temporary array is allocated.
+        NOTE: pressure is expressed in [bar].
+        """
+
+        n_rows, n_cols = out.shape
+        # Threads share (row, column block) tasks; inner loops run along columns
+        # with no index arithmetic, so that they are SIMD-vectorized.
+        n_blocks = (n_cols + COL_BLOCK - 1) // COL_BLOCK
+        for task in prange(n_rows * n_blocks):
+            row = task // n_blocks
+            start = (task % n_blocks) * COL_BLOCK
+            for col in range(start, min(start + COL_BLOCK, n_cols)):
+                out[row, col] = _density(sal[row, col], temp[row, col], press)
+        return out
+
+    @staticmethod
+    @njit(fastmath=True, nogil=True, error_model="numpy", cache=True)
+    def __density_serial_kernel(
+        sal: NDArray, temp: NDArray, press: float, out: NDArray
+    ) -> NDArray:
+        """
+        Serial __density_kernel, for calls from threads other than the main one.
+        NOTE: pressure is expressed in [bar].
+        """
+
+        n_rows, n_cols = out.shape
+        for row in range(n_rows):
+            for col in range(n_cols):
+                out[row, col] = _density(sal[row, col], temp[row, col], press)
+        return out
+
+    @staticmethod
+    @njit(parallel=True, error_model="numpy", cache=True)
+    def __density_sums_kernel(sal: NDArray, temp: NDArray, press: float) -> NDArray:
+        """
+        Compiled column-wise sums and counts of (non-NaN) density, from 2D
+        (rows, columns) salinity and temperature views (rows split among threads).
+        NOTE: pressure is expressed in [bar].
+        """
+
+        n_rows, n_cols = sal.shape
+        n_chunks = min(n_rows, 64)
+        chunk_size = (n_rows + n_chunks - 1) // max(n_chunks, 1)
+        sums = np.zeros((n_chunks, n_cols))
+        counts = np.zeros((n_chunks, n_cols))
+        for c in prange(n_chunks):
+            rows = range(c * chunk_size, min((c + 1) * chunk_size, n_rows))
+            _accumulate_density(sal, temp, press, rows, sums[c], counts[c])
+        out = np.empty((2, n_cols))
+        for k in range(n_cols):
+            out[0, k] = sums[:, k].sum()
+            out[1, k] = counts[:, k].sum()
+        return out
+
+    @staticmethod
+    @njit(nogil=True, error_model="numpy", cache=True)
+    def __density_sums_serial_kernel(
+        sal: NDArray, temp: NDArray, press: float
+    ) -> NDArray:
+        """
+        Serial __density_sums_kernel, for calls from threads other than the main one
+        (e.g. dask blocks). NOTE: pressure is expressed in [bar].
+        """
+
+        out = np.zeros((2, sal.shape[1]))
+        _accumulate_density(sal, temp, press, range(sal.shape[0]), out[0], out[1])
+        return out
+
+    @staticmethod
+    @njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+    def __freshwater_kernel(temp: NDArray, press: float, out: NDArray) -> NDArray:
+        """
+        Compiled evaluation of the Eq. of Seawater for zero salinity (pure water),
+        writing density into 'out'.
+        NOTE: pressure is expressed in [bar].
+        """
+
+        for i in prange(out.size):
+            out[i] = _freshwater_density(temp[i], press)
+        return out
+
+    @staticmethod
+    @njit(fastmath=True, nogil=True, error_model="numpy", cache=True)
+    def __freshwater_serial_kernel(
+        temp: NDArray, press: float, out: NDArray
+    ) -> NDArray:
+        """
+        Serial __freshwater_kernel, for calls from threads other than the main one.
+        NOTE: pressure is expressed in [bar].
+        """
+
+        for i in range(out.size):
+            out[i] = _freshwater_density(temp[i], press)
+        return out
+
+    @staticmethod
+    @njit(parallel=True, fastmath=True, error_model="numpy", cache=True)
+    def __pottemp_kernel(
+        sal: NDArray, temp: NDArray, press: NDArray, ref_press: float, out: NDArray
+    ) -> NDArray:
+        """
+        Compiled evaluation of potential temperature on 2D (rows, columns) views,
+        writing the result into 'out'.
+        NOTE: pressure is expressed in [dbar].
+        """
+
+        n_rows, n_cols = out.shape
+        # Threads share (row, column block) tasks, as in __density_kernel.
+        n_blocks = (n_cols + COL_BLOCK - 1) // COL_BLOCK
+        for task in prange(n_rows * n_blocks):
+            row = task // n_blocks
+            start = (task % n_blocks) * COL_BLOCK
+            for col in range(start, min(start + COL_BLOCK, n_cols)):
+                out[row, col] = _potential_temperature(
+                    sal[row, col], temp[row, col], press[row, col], ref_press
+                )
+        return out
+
+    @staticmethod
+    @njit(fastmath=True, nogil=True, error_model="numpy", cache=True)
+    def __pottemp_serial_kernel(
+        sal: NDArray, temp: NDArray, press: NDArray, ref_press: float, out: NDArray
+    ) -> NDArray:
+        """
+        Serial __pottemp_kernel, for calls from threads other than the main one.
+        NOTE: pressure is expressed in [dbar].
+        """
+
+        n_rows, n_cols = out.shape
+        for row in range(n_rows):
+            for col in range(n_cols):
+                out[row, col] = _potential_temperature(
+                    sal[row, col], temp[row, col], press[row, col], ref_press
+                )
+        return out
+
+    @staticmethod
+    def __compute_rho(sal: float, temp: float, SR: float = None) -> float:
         """
         Compute reference density at atmospheric pressure (where pot_temp = insitu_temp)
 
@@ -162,6 +708,8 @@ class EoS:
             sea water potential temperature [°C]
         sal : <class 'numpy.ndarray'>
             sea water salinity [PSU]
+        SR : <class 'numpy.ndarray'>
+            square root of salinity (computed if not given)
 
         Returns
         -------
@@ -170,29 +718,16 @@ class EoS:
         """
 
         # Square root of salinity.
-        SR = np.sqrt(sal)
-        # Density of pure water.
-        rho_0 = (
-            (
-                ((6.536336e-9 * temp - 1.120083e-6) * temp + 1.001685e-4) * temp
-                - 9.095290e-3
-            )
-            * temp
-            + 6.793952e-2
-        ) * temp + 999.842594
-        # Coefficients involving salinity and pot. temperature.
-        A = (
-            ((5.3875e-9 * temp - 8.2467e-7) * temp + 7.6438e-5) * temp - 4.0899e-3
-        ) * temp + 0.824493
-        B = (-1.6546e-6 * temp + 1.0227e-4) * temp - 5.72466e-3
-        C = 4.8314e-4
+        if SR is None:
+            SR = np.sqrt(sal)
         # International one-atmosphere Eq. of State of seawater.
-        rho = rho_0 + (A + B * SR + C * sal) * sal
+        T2 = temp * temp
+        rho = _rho_term(sal, temp, T2, T2 * T2, SR)
 
         return rho
 
     @staticmethod
-    def __compute_K_0(sal: float, temp: float) -> float:
+    def __compute_K_0(sal: float, temp: float, SR: float = None) -> float:
         """
         Compute bulk modulus of seawater at atmospheric pressure term
 
@@ -208,6 +743,8 @@ class EoS:
             sea water potential temperature [°C]
         sal : <class 'numpy.ndarray'>
             sea water salinity [PSU]
+        SR : <class 'numpy.ndarray'>
+            square root of salinity (computed if not given)
 
         Returns
         -------
@@ -216,24 +753,16 @@ class EoS:
         """
 
         # Square root of salinity.
-        SR = np.sqrt(sal)
-        # Bulk modulus of seawater at atmospheric pressure: pure water term
-        Kw_0 = (
-            ((-4.190253e-05 * temp + 9.648704e-03) * temp - 1.706103) * temp
-            + 1.444304e02
-        ) * temp + 1.965933e04
-        # Coefficients involving salinity and pot. temperature.
-        a = (
-            (-5.084188e-05 * temp + 6.283263e-03) * temp - 3.101089e-01
-        ) * temp + 5.284855e01
-        b = (-4.619924e-04 * temp + 9.085835e-03) * temp + 3.886640e-01
+        if SR is None:
+            SR = np.sqrt(sal)
         # Bulk modulus of seawater at atmospheric pressure.
-        K_0 = Kw_0 + (a + b * SR) * sal
+        T2 = temp * temp
+        K_0 = _K_0_term(sal, temp, T2, T2 * T2, SR)
 
         return K_0
 
     @staticmethod
-    def __compute_A(sal: float, temp: float) -> float:
+    def __compute_A(sal: float, temp: float, SR: float = None) -> float:
         """
         Compute compression term coefficient A in bulk modulus of seawater
 
@@ -249,6 +778,8 @@ class EoS:
             sea water potential temperature [°C]
         sal : <class 'numpy.ndarray'>
             sea water salinity [PSU]
+        SR : <class 'numpy.ndarray'>
+            square root of salinity (computed if not given)
 
         Returns
         -------
@@ -257,14 +788,11 @@ class EoS:
         """
 
         # Square root of salinity.
-        SR = np.sqrt(sal)
+        if SR is None:
+            SR = np.sqrt(sal)
         # Compression term.
-        Aw = (
-            (1.956415e-06 * temp - 2.984642e-04) * temp + 2.212276e-02
-        ) * temp + 3.186519
-        c = (2.059331e-07 * temp - 1.847318e-04) * temp + 6.704388e-03
-        d = 1.480266e-04
-        A = Aw + (c + d * SR) * sal
+        T2 = temp * temp
+        A = _A_term(sal, temp, T2, T2 * T2, SR)
 
         return A
 
@@ -293,9 +821,8 @@ class EoS:
         """
 
         # Compression term.
-        Bw = (1.394680e-07 * temp - 1.202016e-05) * temp + 2.102898e-04
-        e = (6.207323e-10 * temp + 6.128773e-08) * temp - 2.040237e-06
-        B = Bw + e * sal
+        T2 = temp * temp
+        B = _B_term(sal, temp, T2, T2 * T2)
 
         return B
 
@@ -307,22 +834,7 @@ class EoS:
         :params sal, temp, press : salinity, temperature, pressure
         """
 
-        DS = sal - 35.0
-        ATG = (
-            (
-                ((-2.1687e-16 * temp + 1.8676e-14) * temp - 4.6206e-13) * press
-                + (
-                    (2.7759e-12 * temp - 1.1351e-10) * DS
-                    + ((-5.4481e-14 * temp + 8.733e-12) * temp - 6.7795e-10) * temp
-                    + 1.8741e-8
-                )
-            )
-            * press
-            + (-4.2393e-8 * temp + 1.8932e-6) * DS
-            + ((6.6228e-10 * temp - 6.836e-8) * temp + 8.5258e-6) * temp
-            + 3.5803e-5
-        )
-        return ATG
+        return _adiabtempgrad(sal, temp, press)
 
 
 if __name__ == "__main__":
@@ -332,37 +844,116 @@ if __name__ == "__main__":
     # Reference values may be found within
     # 'Algorithms for computation of fundamental properties of seawater'
     # (UNESCO, 1983. Section 3, p.19)
-    ref_sal = [0, 35]  # PSU
-    ref_temp = [5, 25]  # °C
-    ref_rho = [999.96675, 997.04796, 1027.67547, 1023.34306]  # kg/m^3
-    out_rho = []
-    for sal in ref_sal:
-        for temp in ref_temp:
-            out_rho.append(EoS._EoS__compute_rho(sal, temp))
+    # Table of (salinity [PSU], temperature [°C], density [kg/m^3]) check values,
+    # all checked with a single call.
+    ref_table = np.array(
+        [
+            [0, 5, 999.96675],
+            [0, 25, 997.04796],
+            [35, 5, 1027.67547],
+            [35, 25, 1023.34306],
+        ]
+    )
+    ref_sal, ref_temp, ref_rho = ref_table.T
     error = 1e-06  # kg/m^3
-    assert np.allclose(ref_rho, out_rho, atol=error)
+    assert np.allclose(EoS._EoS__compute_rho(ref_sal, ref_temp), ref_rho, atol=error)
+    # At atmospheric pressure, density is the reference one.
+    assert np.allclose(EoS.compute_density(ref_sal, ref_temp), ref_rho, atol=error)
+    # Single precision inputs meet UNESCO check values within float32 round-off.
+    out_rho_32 = EoS.compute_density(
+        ref_sal.astype(np.float32), ref_temp.astype(np.float32)
+    )
+    assert out_rho_32.dtype == np.float32
+    assert np.allclose(ref_rho, out_rho_32, atol=1e-3)
 
     # Test adiabatic lapse rate and potential temperature.
     # From UNESCO documentation.
     assert np.isclose(EoS._EoS__adiabtempgrad(40, 40, 10000), 3.255976e-4)
     assert np.isclose(EoS.potential_temperature(40, 40, 10000), 36.89073)
+    # Compiled (numpy) and element-wise (python) paths give the same result.
+    test_press = np.linspace(0, 5000, 11)
+    assert np.allclose(
+        EoS.potential_temperature(35.0, 10.0, test_press),
+        _potential_temperature(35.0, 10.0, test_press, 0),
+    )
 
     # Test Compute density from Jackett and Mcdougall (1995).
     assert np.isclose(EoS.compute_density(35.5, 3.0, 3000), 1041.83267)
+    # Other array-like objects (e.g. lists) take the fallback ufunc.
+    assert np.allclose(EoS.compute_density([35.5], [3.0], 3000), 1041.83267)
     # Test conversion from pressure to depth.
     # From UNESCO documentation.
     assert np.isclose(EoS.press2depth(10000, 30), 9712.653)
 
+    # Check fused kernel against the term-by-term computation.
+    test_sal = np.random.rand(3, 10, 2, 15) * 35.5
+    test_temp = np.random.rand(3, 10, 2, 15) * 30
+    # Terms do not depend on pressure: they are evaluated once, in one pass each,
+    # and combined for all pressures by broadcasting (pressure as first axis).
+    rho = EoS._EoS__compute_rho(test_sal, test_temp)
+    K_0 = EoS._EoS__compute_K_0(test_sal, test_temp)
+    A = EoS._EoS__compute_A(test_sal, test_temp)
+    B = EoS._EoS__compute_B(test_sal, test_temp)
+    test_press = np.array([0.0, 3000.0])
+    p = (test_press / 10).reshape((-1,) + (1,) * test_sal.ndim)
+    expected_density = rho / (1 - p / (K_0 + p * (A + p * B)))
+    for press, density in zip(test_press, expected_density):
+        assert np.allclose(EoS.compute_density(test_sal, test_temp, press), density)
+
     # Check if it works for 4D array
     test_sal = np.random.rand(3, 10, 2, 15) * 35.5
     print(f"input salinity has dims {test_sal.shape}")
-    test_temp = np.ones_like(test_sal) * 25
+    # Constant temperature is exact in single precision (half the memory).
+    test_temp = np.full(test_sal.shape, 25, dtype=np.float32)
     test_4d = EoS.compute_density(test_sal, test_temp)
     print(f"4D density as shape {test_4d.shape}")
     try:
-        EoS.compute_density(test_sal, test_temp[:,:,0,:])
+        EoS.compute_density(test_sal, test_temp[:, :, 0, :])
     except ValueError:
         print("Not working if temp and sal has different shape")
     EoS.compute_density(test_sal[0], test_temp[0, 0, :, :])
     EoS.compute_density(test_sal, test_temp[0, :, :])
+
+    # Test fresh water path gives the same result as the general one.
+    assert np.allclose(
+        EoS.compute_density(0, test_temp, 3000),
+        EoS.compute_density(np.zeros_like(test_temp), test_temp, 3000),
+    )
+    assert np.isclose(EoS.compute_density(0, 5), ref_rho[0], atol=error)
+    # Test single precision inputs are computed in single precision.
+    density_32 = EoS.compute_density(
+        test_sal.astype(np.float32), test_temp.astype(np.float32), 3000
+    )
+    assert density_32.dtype == np.float32
+    assert np.allclose(
+        density_32, EoS.compute_density(test_sal, test_temp, 3000), rtol=1e-6
+    )
+    # Test xarray inputs are computed on their data, keeping labels.
+    xr_sal = xr.DataArray(test_sal, dims=("time", "lon", "lat", "depth"))
+    xr_temp = xr.DataArray(test_temp, dims=("time", "lon", "lat", "depth"))
+    xr_density = EoS.compute_density(xr_sal, xr_temp, 3000)
+    assert isinstance(xr_density, xr.DataArray) and xr_density.dims == xr_sal.dims
+    assert np.allclose(xr_density, EoS.compute_density(test_sal, test_temp, 3000))
+    # Test calls from other threads (serial kernels) give the same result.
+    thread_results = []
+    thread = threading.Thread(
+        target=lambda: thread_results.append(
+            EoS.compute_density(test_sal, test_temp, 3000)
+        )
+    )
+    thread.start()
+    thread.join()
+    assert np.allclose(
+        thread_results[0], EoS.compute_density(test_sal, test_temp, 3000)
+    )
     print("Working if the first dimension is missing from one of the two arrays")
+    # Test mean density profile (single pass) against mean of density field.
+    test_sal[0, 0, 0, :3] = np.nan
+    expected_profile = np.nanmean(
+        EoS.compute_density(test_sal, test_temp, 3000), axis=(0, 1, 2)
+    )
+    # Labels are not checked here: only temperature is wrapped in xarray,
+    # to test that the unwrapped data are reduced.
+    assert np.allclose(
+        EoS.mean_density_profile(test_sal, xr_temp, 3000), expected_profile
+    )
@@ -1,6 +1,5 @@
 import numpy as np
 from numpy.typing import NDArray
-from scipy.interpolate import RegularGridInterpolator, LinearNDInterpolator, interpn
 
 
 class Interpolation:
@@ -36,19 +35,17 @@ class Interpolation:
             step (float): grid step
         """
 
-        # Create new equally spaced depth array (interpolation depth levels).
-        interp_depth_levels = np.arange(start, stop + step, step)
+        # Create new equally spaced depth array (interpolation depth levels),
+        # from the number of levels: a float step may otherwise add a level
+        # beyond 'stop', due to round-off (e.g. np.arange(0, 10.1, 0.1)).
+        n_levels = int(np.ceil(np.round((stop - start) / step, decimals=9))) + 1
+        interp_depth_levels = start + np.arange(n_levels) * step
         # Interpolate field(s)
         interp_fields = ()
         for field in self.fields:
-            if field.ndim == 1:
-                interp_field = Interpolation.vert_interp(
-                    field, self.depth, interp_depth_levels
-                )
-            else:
-                interp_field = Interpolation.vert_interp_nd(
-                    field, self.depth, interp_depth_levels
-                )
+            interp_field = Interpolation.vert_interp_nd(
+                field, self.depth, interp_depth_levels
+            )
             interp_fields += (interp_field,)
         if return_depth:
             interp_fields += (interp_depth_levels,)
@@ -69,22 +66,34 @@ class Interpolation:
             interp_depth_levels : new grid on which "field" should be interpolated
         """
 
-        # Remove NaN values
-        depth = np.delete(depth, np.where(np.isnan(field)))
-        field = np.delete(field, np.where(np.isnan(field)), axis=-1)
+        # Remove NaN values (only if there are any).
+        nan_mask = np.isnan(field)
+        if nan_mask.any():
+            valid = ~nan_mask
+            depth = depth[valid]
+            field = field[valid]
+        # Return nan array if the profile has less than two valid values.
+        if field.shape[0] < 2:
+            return np.full(interp_depth_levels.shape, np.nan)
+        # Interpolation requires increasing depth values.
+        if depth[0] > depth[-1]:
+            depth = depth[::-1]
+            field = field[::-1]
         # Interpolate
-        try:
-            interp = RegularGridInterpolator(
-                (depth,),
-                field,
-                method="linear",
-                bounds_error=False,
-                fill_value=None,
+        interp_profile = np.interp(interp_depth_levels, depth, field)
+        # Linear extrapolation outside the original depth range.
+        above = interp_depth_levels < depth[0]
+        if above.any():
+            slope = (field[1] - field[0]) / (depth[1] - depth[0])
+            interp_profile[above] = (
+                field[0] + (interp_depth_levels[above] - depth[0]) * slope
+            )
+        below = interp_depth_levels > depth[-1]
+        if below.any():
+            slope = (field[-1] - field[-2]) / (depth[-1] - depth[-2])
+            interp_profile[below] = (
+                field[-1] + (interp_depth_levels[below] - depth[-1]) * slope
             )
-            interp_profile = interp(interp_depth_levels)
-        # Return nan array if the whole profile is NaN.
-        except IndexError:
-            interp_profile = interp_depth_levels * np.nan
         # Return interpolated profile and interpolation depth levels.
         return interp_profile
 
@@ -101,18 +110,19 @@ class Interpolation:
             interp_depth_levels : new grid on which "field" should be interpolated (1D)
         """
 
+        # Work on raw numpy arrays (e.g. xarray inputs are not wrapped per profile).
+        field = np.asarray(field)
+        depth = np.asarray(depth)
+        # Any number of dimensions (1D included) is handled as a stack of profiles.
         flattened_field = field.reshape(-1, field.shape[-1])
-        interp_field = []
-        for profile in flattened_field:
-            interp_profile = Interpolation.vert_interp(
+        interp_field = np.empty(
+            (flattened_field.shape[0], interp_depth_levels.shape[0])
+        )
+        for i, profile in enumerate(flattened_field):
+            interp_field[i] = Interpolation.vert_interp(
                 profile, depth, interp_depth_levels
             )
-            interp_field.append(interp_profile)
-        interp_field = np.reshape(
-            np.array(interp_field),
-            field.shape[:-1] + (interp_depth_levels.shape[0],),
-        )
-        return interp_field
+        return interp_field.reshape(field.shape[:-1] + interp_field.shape[-1:])
 
 
 if __name__ == "__main__":
@@ -131,13 +141,13 @@ if __name__ == "__main__":
     field[0] = expected_field[1]
     field[-1] = expected_field[-1]
     interpolation = Interpolation(z, field)
-    (interpolated_field, interp_depth) = interpolation.apply_interpolation(0, H, step)
+    interpolated_field, interp_depth = interpolation.apply_interpolation(0, H, step)
     print(interpolated_field[:10], expected_field[:10])
     assert np.allclose(interpolated_field, expected_field, atol=1e-07)
     print("OK: Nan values are treated well.")
 
     # Test interpolation gives the same results for two different grid steps.
-    (interp_field_2, interp_depth_2) = interpolation.apply_interpolation(0, H, step / 2)
+    interp_field_2, interp_depth_2 = interpolation.apply_interpolation(0, H, step / 2)
     assert np.allclose(interp_field_2[::2], interpolated_field, atol=1e-08)
     print("OK: same results with different grid steps.")
 
@@ -148,8 +158,8 @@ if __name__ == "__main__":
     z_4 = np.linspace(0, H_4, n_steps)
     interp_3 = Interpolation(z_3, field)
     interp_4 = Interpolation(z_4, field)
-    (interp_field_3, interp_depth_3) = interp_3.apply_interpolation(0, H_3, step)
-    (interp_field_4, interp_depth_4) = interp_4.apply_interpolation(0, H_4, step)
+    interp_field_3, interp_depth_3 = interp_3.apply_interpolation(0, H_3, step)
+    interp_field_4, interp_depth_4 = interp_4.apply_interpolation(0, H_4, step)
     assert interp_field_3.shape == interp_field_4.shape
     print(
         f"OK: if mean depth diff {H_4-H_3} is less than step {step}, output arrays have same lengths."
@@ -157,7 +167,7 @@ if __name__ == "__main__":
     # Test 3D array
     arr3d = np.random.rand(12, 13, n_steps)
     interp3d = Interpolation(z, arr3d)
-    (interp_result, interp_depth_result) = interp3d.apply_interpolation(0, 100, 1)
+    interp_result, interp_depth_result = interp3d.apply_interpolation(0, 100, 1)
     assert interp_result.shape == (12, 13, 101)
     print("OK: vertical interpolation works for 3D array.")
 
@@ -166,7 +176,7 @@ if __name__ == "__main__":
     depth = np.arange(10)
     correct_interpolation = np.arange(10)
     interp = Interpolation(depth, test_arr)
-    (interp_arr, interp_depth_arr) = interp.apply_interpolation(0, depth[-1], 1)
+    interp_arr, interp_depth_arr = interp.apply_interpolation(0, depth[-1], 1)
     print(interp_arr)
     assert np.allclose(interp_arr, correct_interpolation)
 
@@ -29,7 +29,31 @@ class Utils:
     def find_nearvals(array: NDArray, *vals: float or np.datetime64) -> list[int]:
         """
         Find array indeces corresponding to min and max values of a range.
+        Monotonic (coordinate) arrays are binary searched, without temporaries
+        of the array size; otherwise, the nearest value is found by a full scan.
         """
+        array = np.asarray(array)
+        # Time queries (np.datetime64, pd.Timestamp or str) are cast to the time
+        # array unit, so that they are compared as plain datetime64 values.
+        if np.issubdtype(array.dtype, np.datetime64):
+            values = np.asarray(vals, dtype=array.dtype)
+        else:
+            values = np.asarray(vals)
+        n = array.shape[0] if array.ndim == 1 else 0
+        if n > 1 and values.dtype != object:
+            ascending = array[-1] >= array[0]
+            sorted_array = array if ascending else array[::-1]
+            # Strictly monotonic arrays only (NaNs fail the check, too).
+            if np.all(sorted_array[1:] > sorted_array[:-1]):
+                right = np.clip(np.searchsorted(sorted_array, values), 1, n - 1)
+                left_dist = np.abs(values - sorted_array[right - 1])
+                right_dist = np.abs(values - sorted_array[right])
+                # On ties, keep the first index of the original array.
+                if ascending:
+                    ids = np.where(left_dist <= right_dist, right - 1, right)
+                else:
+                    ids = n - 1 - np.where(left_dist < right_dist, right - 1, right)
+                return ids.tolist()
         ids = [np.argmin(np.abs((array - val))) for val in vals]
         return ids
 
@@ -38,3 +62,12 @@ if __name__ == "__main__":
     b = False
     assert Utils.andor(a,a) and Utils.andor(a,b) and Utils.andor(b,a)
     assert not Utils.andor(b,b)
+    # Test nearest values for ascending, descending and unsorted arrays.
+    assert Utils.find_nearvals(np.arange(1, 11), 2.3, 4.5, 6.9) == [1, 3, 6]
+    assert Utils.find_nearvals(np.arange(10, 0, -1), 2.3, 4.5, 6.9) == [8, 5, 3]
+    assert Utils.find_nearvals(np.array([3, 1, 2]), 1.2, 2.9) == [1, 0]
+    time = np.arange("2021-01-01", "2021-02-01", dtype="datetime64[h]").astype(
+        "datetime64[ns]"
+    )
+    near_times = Utils.find_nearvals(time, np.datetime64("2021-01-21T12"), "2021-01-26")
+    assert near_times == [492, 600]